@@ -0,0 +1,120 @@
+# _rasterize.py
+"""
+Numba kernels that rasterize MPE scenes straight into a uint8 RGB buffer.
+Used by rendering.Viewer when every geom is a (stroked) disk; numba is
+optional and rendering falls back to matplotlib when it is missing or the
+kernel fails to compile even without the on-disk cache (raster_disks is then
+None).
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+# Output tile edge in pixels; each tile is one prange work item and only
+# visits the disks whose bounding box overlaps it.
+TILE = 64
+
+
+# Explicit signature: numba compiles at import instead of on the first frame,
+# and cache=True stores the result next to this module, so later processes
+# (e.g. vectorized env workers) load it from disk without invoking LLVM.
+RASTER_DISKS_SIG = ("void(u1[:, :, ::1], f4[::1], f4[::1], f4[::1], f4[::1], "
+                    "u1[:, ::1], u1[:, ::1])")
+
+
+def _blend_span(img, y, xa, xb, rgba, k):
+    # alpha-blend color k of rgba over img[y, xa:xb + 1]
+    a = int(rgba[k, 3])
+    for x in range(xa, xb + 1):
+        for c in range(3):
+            img[y, x, c] = (int(rgba[k, c]) * a + int(img[y, x, c]) * (255 - a) + 127) // 255
+
+
+def _raster_disks(img, cx, cy, r, w, face, edge):
+    """Alpha-blend disks k = 0..n-1 into img (H, W, 3), in order.
+
+    Each disk is filled in face[k] and then, like matplotlib's edge stroke,
+    gets a ring of width w[k] centered on its rim in edge[k]. cx, cy, r, w
+    are contiguous float32 pixels (row 0 at the top, pixel centers at +0.5);
+    face and edge are C-contiguous (n, 4) uint8 arrays of colors; img must
+    be C-contiguous.
+    """
+    h, wd = img.shape[0], img.shape[1]
+    n = cx.shape[0]
+    n_tiles_x = (wd + TILE - 1) // TILE
+    n_tiles_y = (h + TILE - 1) // TILE
+    for tile_idx in prange(n_tiles_y * n_tiles_x):
+        y0 = (tile_idx // n_tiles_x) * TILE
+        x0 = (tile_idx % n_tiles_x) * TILE
+        y1 = min(y0 + TILE, h)
+        x1 = min(x0 + TILE, wd)
+
+        # early-reject disks whose (stroked) bounding box misses the tile
+        active = np.empty(n, dtype=np.int64)
+        n_active = 0
+        for k in range(n):
+            ro = r[k] + 0.5 * w[k]
+            if (cx[k] + ro >= x0 and cx[k] - ro <= x1
+                    and cy[k] + ro >= y0 and cy[k] - ro <= y1):
+                active[n_active] = k
+                n_active += 1
+        if n_active == 0:
+            continue
+
+        for y in range(y0, y1):
+            py = y + 0.5
+            for j in range(n_active):
+                k = active[j]
+                dy2 = (py - cy[k]) ** 2
+                # pixels with dy2 + (x + 0.5 - cx)**2 <= rr**2 form one span
+                ro = r[k] + 0.5 * w[k]
+                if dy2 > ro * ro:
+                    continue
+                half = math.sqrt(ro * ro - dy2)
+                xa = max(int(math.ceil(cx[k] - half - 0.5)), x0)
+                xb = min(int(math.floor(cx[k] + half - 0.5)), x1 - 1)
+                r2 = r[k] * r[k]
+                if dy2 <= r2:
+                    half = math.sqrt(r2 - dy2)
+                    _blend_span(img, y, max(int(math.ceil(cx[k] - half - 0.5)), x0),
+                                min(int(math.floor(cx[k] + half - 0.5)), x1 - 1), face, k)
+                if w[k] <= 0.0:
+                    continue
+                # the ring: the outer span minus the part within the inner radius
+                ri = max(r[k] - 0.5 * w[k], 0.0)
+                if dy2 > ri * ri:
+                    _blend_span(img, y, xa, xb, edge, k)
+                else:
+                    half = math.sqrt(ri * ri - dy2)
+                    _blend_span(img, y, xa, min(int(math.ceil(cx[k] - half - 0.5)) - 1, xb), edge, k)
+                    _blend_span(img, y, max(int(math.floor(cx[k] + half - 0.5)) + 1, xa), xb, edge, k)
+
+
+raster_disks = None
+if HAVE_NUMBA:
+    # The eager compile (or loading a stale/foreign on-disk cache) runs at
+    # import time; never let it make rendering unimportable. A bad cache only
+    # costs the cache, so retry once compiling from scratch. The helper is
+    # compiled lazily, as part of raster_disks.
+    _blend_span = njit(fastmath=True, boundscheck=False)(_blend_span)
+    for _cache in (True, False):
+        try:
+            raster_disks = njit(RASTER_DISKS_SIG, parallel=True, cache=_cache,
+                                fastmath=True, boundscheck=False)(_raster_disks)
+            break
+        except Exception as exc:
+            fallback = "retrying without the on-disk cache" if _cache else \
+                "rendering falls back to matplotlib"
+            warnings.warn(f"numba disk rasterizer unavailable ({exc!r}); {fallback}",
+                          RuntimeWarning)
+    del _cache
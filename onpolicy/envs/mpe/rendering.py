@@ -10,21 +10,43 @@ from __future__ import annotations
 import matplotlib
 matplotlib.use("Agg")
 
+import copy
+import functools
 import math
 import numpy as np
 
 from matplotlib.figure import Figure
 from matplotlib.patches import Circle as MplCircle, Polygon as MplPolygon
 from matplotlib.lines import Line2D
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 from matplotlib import transforms as mtransforms
 
+from ._rasterize import raster_disks
+
 
 RAD2DEG = 57.29577951308232
 
+# Same outline matplotlib's Circle patch draws, in data units for radius 1
+_UNIT_CIRCLE = Path.unit_circle()
+
+
+def _apply_affine(matrix, pts):
+    # Direct 2x3 matmul; Affine2D.transform costs far more in Python-level
+    # overhead than the math itself for a handful of vertices.
+    return pts @ matrix[:2, :2].T + matrix[:2, 2]
+
 
-def _clamp01(x: float) -> float:
-    return float(max(0.0, min(1.0, x)))
+def _similarity_scale(matrix):
+    # Scale factor of a 2D affine whose linear part is a (possibly mirrored)
+    # scaled rotation, under which circles stay circles; None for any other
+    # affine (e.g. Transform.set_scale(sx, sy) with sx != sy).
+    (a, b), (c, d) = matrix[:2, :2]
+    tol = 1e-9 * (abs(a) + abs(b) + abs(c) + abs(d))
+    if (abs(a - d) <= tol and abs(b + c) <= tol) or (abs(a + d) <= tol and abs(b - c) <= tol):
+        return math.sqrt(abs(a * d - b * c))
+    return None
 
 
 class Attr:
@@ -37,9 +59,13 @@ class Attr:
 
 class Color(Attr):
     def __init__(self, vec4):
-        # (r, g, b, a), each in [0,1]
-        r, g, b, a = vec4
-        self.vec4 = (_clamp01(r), _clamp01(g), _clamp01(b), _clamp01(a))
+        # (r, g, b, a), each clipped to [0,1] in one vectorized pass
+        self.rgba = np.asarray(vec4, dtype=np.float32).reshape(4).copy()
+        np.clip(self.rgba, 0.0, 1.0, out=self.rgba)
+
+    @property
+    def vec4(self):
+        return tuple(self.rgba.tolist())
 
     def enable(self, *args, **kwargs):
         # handled in Geom draw path
@@ -57,70 +83,135 @@ class LineWidth(Attr):
 
 class Transform(Attr):
     def __init__(self, translation=(0.0, 0.0), rotation=0.0, scale=(1.0, 1.0)):
+        # The 3x3 matrix is memoized; setters only mark it dirty (and bump
+        # _version, which Geom uses to memoize composed transforms) when a
+        # value actually changes.
+        self._dirty = True
+        self._cached = None
+        self._version = 0
+        self._translation = None
+        self._rotation = None
+        self._scale = None
         self.set_translation(*translation)
         self.set_rotation(rotation)
         self.set_scale(*scale)
 
+    def _touch(self):
+        self._dirty = True
+        self._version += 1
+
+    @property
+    def translation(self):
+        return self._translation
+
+    @translation.setter
+    def translation(self, value):
+        self.set_translation(*value)
+
+    @property
+    def rotation(self):
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        self.set_rotation(value)
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self.set_scale(*value)
+
     def set_translation(self, newx, newy):
-        self.translation = (float(newx), float(newy))
+        translation = (float(newx), float(newy))
+        if translation != self._translation:
+            self._translation = translation
+            self._touch()
 
     def set_rotation(self, new):
-        self.rotation = float(new)  # radians
+        rotation = float(new)  # radians
+        if rotation != self._rotation:
+            self._rotation = rotation
+            self._touch()
 
     def set_scale(self, newx, newy):
-        self.scale = (float(newx), float(newy))
+        scale = (float(newx), float(newy))
+        if scale != self._scale:
+            self._scale = scale
+            self._touch()
+
+    @property
+    def matrix3x3(self) -> np.ndarray:
+        # Same operation order as matplotlib's scale().rotate().translate().
+        if self._dirty:
+            tx, ty = self._translation
+            sx, sy = self._scale
+            cos = math.cos(self._rotation)
+            sin = math.sin(self._rotation)
+            m = np.array([[sx * cos, -sy * sin, tx],
+                          [sx * sin, sy * cos, ty],
+                          [0.0, 0.0, 1.0]])
+            m.flags.writeable = False
+            self._cached = m
+            self._dirty = False
+        return self._cached
 
     def as_affine(self) -> mtransforms.Affine2D:
-        t = mtransforms.Affine2D()
         # Match the original GL order by composing in the same sequence used on enable().
         # In the original code transforms were enabled in reversed(self.attrs).
         # We'll compose the per-Transform operation here; Geom will decide ordering.
-        tx, ty = self.translation
-        sx, sy = self.scale
-        if sx != 1.0 or sy != 1.0:
-            t = t.scale(sx, sy)
-        if self.rotation != 0.0:
-            t = t.rotate(self.rotation)
-        if tx != 0.0 or ty != 0.0:
-            t = t.translate(tx, ty)
-        return t
+        return mtransforms.Affine2D(matrix=self.matrix3x3)
 
 
 class Geom:
     def __init__(self):
+        # Color, LineWidth and Transforms live in dedicated slots (filled by
+        # add_attr); attrs only keeps any other Attr types.
         self._color = Color((0.0, 0.0, 0.0, 1.0))
-        self.attrs = [self._color]
         self._linewidth = LineWidth(1.0)
+        self._transforms = []
+        self.attrs = []
+        # (key, matrix) of the last composed transform, see _collect_matrix
+        self._xform_cache = (None, None)
 
     # API compatibility with original
     def add_attr(self, attr: Attr):
-        self.attrs.append(attr)
+        if isinstance(attr, Transform):
+            self._transforms.append(attr)
+        elif isinstance(attr, Color):
+            self._color = attr
+        elif isinstance(attr, LineWidth):
+            self._linewidth = attr
+        else:
+            self.attrs.append(attr)
 
     def set_color(self, r, g, b, alpha=1.0):
         self._color = Color((r, g, b, alpha))
-        # keep it present/last-set in attrs
-        # remove previous Color if exists then append fresh one
-        self.attrs = [a for a in self.attrs if not isinstance(a, Color)]
-        self.attrs.append(self._color)
 
     def set_linewidth(self, x):
         self._linewidth = LineWidth(x)
 
     # Helpers for subclasses
-    def _collect_transform(self) -> mtransforms.Affine2D:
+    def _collect_matrix(self) -> np.ndarray:
         # Emulate original GL order: enable() was called in reversed(self.attrs)
-        # so we’ll multiply transforms in reversed attr order.
-        affine = mtransforms.Affine2D()
-        for attr in reversed(self.attrs):
-            if isinstance(attr, Transform):
-                affine = affine + attr.as_affine()
-        return affine
+        # so we’ll multiply transforms in reversed add_attr order.
+        key = tuple((id(t), t._version) for t in self._transforms)
+        cached_key, matrix = self._xform_cache
+        if key != cached_key:
+            matrix = np.eye(3)
+            for t in reversed(self._transforms):
+                matrix = t.matrix3x3 @ matrix
+            self._xform_cache = (key, matrix)
+        return matrix
+
+    def _collect_transform(self) -> mtransforms.Affine2D:
+        return mtransforms.Affine2D(matrix=self._collect_matrix())
 
     def _get_colors(self):
-        r, g, b, a = self._color.vec4
-        face = (r, g, b, a)
-        edge = (0.5 * r, 0.5 * g, 0.5 * b, 0.5 * a)
-        return face, edge
+        face = self._color.rgba
+        return face, 0.5 * face
 
     def _get_linewidth(self):
         return self._linewidth.stroke
@@ -130,60 +221,247 @@ class Geom:
         raise NotImplementedError
 
 
-class FilledPolygon(Geom):
+class _Primitive(Geom):
+    # Leaf geoms: draw with an explicit matrix so Compound can pass a fused one.
+    def draw(self, ax):
+        return self._draw(ax, self._collect_matrix())
+
+    def _draw(self, ax, matrix):
+        raise NotImplementedError
+
+
+class FilledPolygon(_Primitive):
     def __init__(self, v):
         super().__init__()
         # v: list of (x, y)
         self.v = np.asarray(v, dtype=float)
 
-    def draw(self, ax):
+    def _draw(self, ax, matrix):
         face, edge = self._get_colors()
         patch = MplPolygon(self.v, closed=True, facecolor=face, edgecolor=edge, linewidth=self._get_linewidth())
-        patch.set_transform(self._collect_transform() + ax.transData)
+        patch.set_transform(mtransforms.Affine2D(matrix) + ax.transData)
         ax.add_patch(patch)
 
 
-class PolyLine(Geom):
+class PolyLine(_Primitive):
     def __init__(self, v, close: bool):
         super().__init__()
-        self.v = np.asarray(v, dtype=float)
         self.close = bool(close)
+        self.v = v
 
-    def draw(self, ax):
-        face, edge = self._get_colors()
+    @property
+    def v(self):
+        return self._v
+
+    @v.setter
+    def v(self, v):
+        v = np.asarray(v, dtype=float)
         if self.close:
-            # close loop by repeating first point
-            pts = np.vstack([self.v, self.v[0]])
+            # close loop by repeating first point, once instead of per draw; v
+            # is a view into that buffer, so in-place edits of v land in it
+            self._pts = np.empty((len(v) + 1, 2))
+            self._pts[:-1] = v
+            self._pts[-1] = v[0]
+            self._v = self._pts[:-1]
         else:
-            pts = self.v
-        line = Line2D(pts[:, 0], pts[:, 1], linewidth=self._get_linewidth(), color=edge)
+            self._pts = self._v = v
+
+    def _points(self):
+        # only the closing point can lag behind an in-place edit of v
+        pts = self._pts
+        if self.close and (pts[-1] != pts[0]).any():
+            pts[-1] = pts[0]
+        return pts
+
+    def _draw(self, ax, matrix):
+        face, edge = self._get_colors()
         # Apply transform to data coordinates by transforming the points beforehand
-        aff = self._collect_transform()
-        pts_t = aff.transform(pts)
-        line.set_data(pts_t[:, 0], pts_t[:, 1])
+        pts_t = _apply_affine(matrix, self._points())
+        line = Line2D(pts_t[:, 0], pts_t[:, 1], linewidth=self._get_linewidth(), color=edge)
         ax.add_line(line)
 
 
-class Circle(Geom):
+class Circle(_Primitive):
     def __init__(self, radius=10.0):
         super().__init__()
         self.radius = float(radius)
 
-    def draw(self, ax):
+    def _draw(self, ax, matrix):
         face, edge = self._get_colors()
         patch = MplCircle((0.0, 0.0), self.radius, facecolor=face, edgecolor=edge, linewidth=self._get_linewidth())
-        patch.set_transform(self._collect_transform() + ax.transData)
+        patch.set_transform(mtransforms.Affine2D(matrix) + ax.transData)
         ax.add_patch(patch)
 
 
 class Compound(Geom):
     def __init__(self, geoms):
         super().__init__()
-        self.gs = geoms
+        # Nested compounds are spliced in here, so gs only ever holds leaf
+        # geoms; each child remembers the compounds it came through (outer
+        # first) so their transforms still apply.
+        gs = []
+        self._chains = []
+        for g in geoms:
+            if isinstance(g, Compound):
+                gs.extend(g.gs)
+                self._chains.extend((g,) + chain for chain in g._chains)
+            else:
+                gs.append(g)
+                self._chains.append(())
+        self._gs = tuple(gs)
+        # (parts, fused matrix) per child, see _child_matrix
+        self._fused = [(None, None)] * len(self._gs)
+
+    @property
+    def gs(self):
+        # Read-only: the flattening, chains and fused matrices are built once
+        # and would go stale if the children could change afterwards.
+        return self._gs
+
+    def _child_matrix(self, i) -> np.ndarray:
+        # own transform @ nested compounds' @ child's, memoized on the
+        # identity of the (themselves memoized) part matrices
+        parts = (self._collect_matrix(),) \
+            + tuple(c._collect_matrix() for c in self._chains[i]) \
+            + (self._gs[i]._collect_matrix(),)
+        key, matrix = self._fused[i]
+        if key is None or any(a is not b for a, b in zip(key, parts)):
+            matrix = parts[0]
+            for m in parts[1:]:
+                matrix = matrix @ m
+            self._fused[i] = (parts, matrix)
+        return matrix
 
     def draw(self, ax):
-        for g in self.gs:
-            g.draw(ax)
+        for i, g in enumerate(self.gs):
+            if isinstance(g, _Primitive):
+                g._draw(ax, self._child_matrix(i))
+            else:
+                g.draw(ax)
+
+
+class _GeomArrays:
+    """Render state of a list of geoms as parallel numpy arrays (SoA).
+
+    Each leaf geom (a Compound contributes its flattened children) owns one
+    row of kind, xyr (circle center and radius in data coordinates), round
+    (False for circles that a non-uniform scale turns into ellipses, which
+    xyr cannot describe), rgba and lw, plus an entry in verts (transformed vertices of polygons and
+    polylines) and in paths (the row's data-space Path, built on first use
+    by path()). sync() refreshes the rows from their geoms, recomputing
+    geometry only for rows whose transform or shape (circle radius, polygon
+    and polyline vertices, also when edited in place) changed since the
+    last frame.
+    The public geoms list may be edited in place; sync() notices when its
+    entries no longer match the ones the rows were built from and rebuilds.
+    """
+
+    CIRCLE, POLYGON, POLYLINE, OTHER = range(4)
+
+    def __init__(self, geoms=()):
+        self._reset(geoms)
+
+    def _reset(self, geoms):
+        self.geoms = []
+        # the geoms the rows were built from, in order
+        self._added = []
+        self._prims = []
+        self._kinds = []
+        self._keys = []
+        self._shapes = []
+        self.verts = []
+        self.paths = []
+        self._stale = True
+        for g in geoms:
+            self.append(g)
+
+    def append(self, geom: Geom):
+        self.geoms.append(geom)
+        self._added.append(geom)
+        if isinstance(geom, Compound):
+            for i, g in enumerate(geom.gs):
+                self._add_prim(g, geom, i)
+        else:
+            self._add_prim(geom, None, 0)
+        self._stale = True
+
+    def _add_prim(self, g, owner, index):
+        if isinstance(g, Circle):
+            kind = self.CIRCLE
+        elif isinstance(g, FilledPolygon):
+            kind = self.POLYGON
+        elif isinstance(g, PolyLine):
+            kind = self.POLYLINE
+        else:
+            kind = self.OTHER
+        self._prims.append((g, owner, index))
+        self._kinds.append(kind)
+        self._keys.append(None)
+        self._shapes.append(None)
+        self.verts.append(None)
+        self.paths.append(None)
+
+    def _alloc(self):
+        n = len(self._prims)
+        self.kind = np.asarray(self._kinds, dtype=np.int8)
+        self.xyr = np.zeros((n, 3))
+        self.round = np.ones(n, dtype=bool)
+        self.rgba = np.zeros((n, 4), dtype=np.float32)
+        self.lw = np.zeros(n, dtype=np.float32)
+        self._keys = [None] * n
+        self._shapes = [None] * n
+        self._stale = False
+
+    def sync(self):
+        if len(self.geoms) != len(self._added) or any(a is not b for a, b in zip(self.geoms, self._added)):
+            # the public geoms list was edited in place
+            self._reset(list(self.geoms))
+        if self._stale:
+            self._alloc()
+        for i, (g, owner, index) in enumerate(self._prims):
+            matrix = g._collect_matrix() if owner is None else owner._child_matrix(index)
+            kind = self.kind[i]
+            # the shape is compared by value: vertex arrays may be edited in
+            # place, which no identity or version check would notice
+            if kind == self.CIRCLE:
+                if self._keys[i] is not matrix or self._shapes[i] != g.radius:
+                    scale = _similarity_scale(matrix)
+                    self.round[i] = scale is not None
+                    self.xyr[i] = (matrix[0, 2], matrix[1, 2], g.radius * (scale or 0.0))
+                    self._shapes[i] = g.radius
+                    self.paths[i] = None
+            elif kind != self.OTHER:
+                if self._keys[i] is not matrix or not np.array_equal(self._shapes[i], g.v):
+                    pts = g.v if kind == self.POLYGON else g._points()
+                    self.verts[i] = _apply_affine(matrix, pts)
+                    self._shapes[i] = g.v.copy()
+                    self.paths[i] = None
+            self._keys[i] = matrix
+            # colors are swapped by set_color every frame; copying is cheaper
+            # than checking whether anything changed
+            self.rgba[i] = g._color.rgba
+            self.lw[i] = g._linewidth.stroke
+
+    def path(self, i) -> Path:
+        # Built lazily (the rasterizer only reads xyr) and kept until sync()
+        # sees the row's geometry change.
+        path = self.paths[i]
+        if path is None:
+            kind = self.kind[i]
+            if kind == self.CIRCLE:
+                # the full affine, so non-uniform scales give ellipses
+                g = self._prims[i][0]
+                path = Path(_apply_affine(self._keys[i], _UNIT_CIRCLE.vertices * g.radius), _UNIT_CIRCLE.codes)
+            elif kind == self.POLYGON:
+                # closed like matplotlib's Polygon patch: repeat the first vertex
+                verts = self.verts[i]
+                if len(verts) and (verts[0] != verts[-1]).any():
+                    verts = np.concatenate([verts, verts[:1]])
+                path = Path(verts, closed=True)
+            else:
+                path = Path(self.verts[i])
+            self.paths[i] = path
+        return path
 
 
 def make_circle(radius=10, res=30, filled=True):
@@ -191,6 +469,25 @@ def make_circle(radius=10, res=30, filled=True):
     return Circle(radius=radius)
 
 
+@functools.lru_cache(maxsize=256)
+def make_circle_cached(radius, r, g, b, a, lw):
+    # Pre-styled Circle template shared by every (radius, color, lw) key.
+    # Treat it as read-only: Viewer.draw_circle hands out clones.
+    geom = Circle(radius=radius)
+    geom.set_color(r, g, b, a)
+    geom.set_linewidth(lw)
+    return geom
+
+
+def _clone(template: Geom) -> Geom:
+    # Color and LineWidth are replaced (never mutated) by the setters, so the
+    # clone can share them; only the attr lists must be its own.
+    geom = copy.copy(template)
+    geom._transforms = list(template._transforms)
+    geom.attrs = list(template.attrs)
+    return geom
+
+
 def make_polygon(v, filled=True):
     if filled:
         return FilledPolygon(v)
@@ -198,6 +495,20 @@ def make_polygon(v, filled=True):
         return PolyLine(v, True)
 
 
+@functools.lru_cache(maxsize=256)
+def make_polygon_cached(v, filled, r, g, b, a, lw):
+    # Pre-styled polygon template per (vertices, filled, color, lw) key, with
+    # v a tuple of (x, y) pairs. Its vertex buffers are shared by every clone,
+    # so they are frozen: assign a new v instead of editing one in place.
+    geom = make_polygon(v, filled=filled)
+    geom.set_color(r, g, b, a)
+    geom.set_linewidth(lw)
+    geom.v.flags.writeable = False
+    if isinstance(geom, PolyLine):
+        geom._pts.flags.writeable = False
+    return geom
+
+
 def make_polyline(v):
     return PolyLine(v, False)
 
@@ -223,58 +534,233 @@ class Viewer:
 
         self.figure = Figure(figsize=(self.width / self.dpi, self.height / self.dpi), dpi=self.dpi)
         self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor((1, 1, 1))
-        self.ax.axis("off")
-        self.geoms = []
+        # The canvas size is fixed once the figure is sized; query it once.
+        self._wh = self.canvas.get_width_height()
+        # A bare full-figure axes: no frame, spines or ticks take part in the
+        # draw, and the white figure patch is the only background.
+        self.ax = self.figure.add_axes((0.0, 0.0, 1.0, 1.0), frameon=False)
+        self.ax.set_aspect('equal', adjustable='box')
+        self.ax.set_axis_off()
+        self._geoms = _GeomArrays()
         self.onetime_geoms = []
 
+        # The axes are never cleared: these two collections are added once
+        # and have their data swapped in for every run of rows (see
+        # _draw_layers). They are animated, so canvas.draw() leaves them out
+        # of the background. Polylines are stroked with Line2D's defaults
+        # (snapping, caps and joins), so they look as they did as Line2Ds.
+        self._fills = PathCollection([], animated=True)
+        self._strokes = PathCollection([], animated=True, facecolor="none", snap=True,
+                                       capstyle="projecting", joinstyle="round")
+        self.ax.add_collection(self._fills)
+        self.ax.add_collection(self._strokes)
+
         # default bounds
         self._bounds = (-1.0, 1.0, -1.0, 1.0)
+        self.ax.set_xlim(-1.0, 1.0)
+        self.ax.set_ylim(-1.0, 1.0)
+        # Snapshot of the empty axes, restored before each frame is blitted.
+        self._bg = None
+        # Data -> axes-pixel matrix for the rasterizer, see _pixel_matrix
+        self._px = None
+        # Reused axes-sized canvas for the rasterizer when the axes do not
+        # cover the whole frame
+        self._scratch = None
 
     def close(self):
         # Nothing to close in headless mode.
         pass
 
     # API compatibility
+    @property
+    def geoms(self):
+        return self._geoms.geoms
+
+    @geoms.setter
+    def geoms(self, geoms):
+        self._geoms = _GeomArrays(geoms)
+
     def set_bounds(self, left, right, bottom, top):
         assert right > left and top > bottom
-        self._bounds = (left, right, bottom, top)
+        bounds = (left, right, bottom, top)
+        if bounds != self._bounds:
+            self._bounds = bounds
+            self.ax.set_xlim(left, right)
+            self.ax.set_ylim(bottom, top)
+            self.invalidate()
+
+    def invalidate(self):
+        # Force a full canvas draw (and a fresh background) on the next render.
+        self._bg = None
+        self._px = None
 
     def add_geom(self, geom: Geom):
-        self.geoms.append(geom)
+        self._geoms.append(geom)
 
     def add_onetime(self, geom: Geom):
         self.onetime_geoms.append(geom)
 
-    def _prepare_axes(self):
-        left, right, bottom, top = self._bounds
-        self.ax.clear()
-        self.ax.set_facecolor((1, 1, 1))
-        self.ax.set_xlim(left, right)
-        self.ax.set_ylim(bottom, top)
-        self.ax.set_aspect('equal', adjustable='box')
-        self.ax.axis("off")
+    def _draw_layers(self, layers):
+        """Draw the layers' rows over the background, in list order.
+
+        Consecutive circles and filled polygons form one run of the fill
+        collection, consecutive polylines one run of the stroke collection;
+        each run has its cached data-space paths and colors swapped in and is
+        drawn in a single call, so no artist is added or removed and
+        _update_patch_limits never runs. Other geoms are drawn between the
+        runs (see _draw_other).
+        """
+        run, run_kind = [], None
+        for layer in layers:
+            # FILL, POLYLINE or OTHER per row; a run never mixes them
+            kind = np.where(layer.kind == _GeomArrays.POLYGON, _GeomArrays.CIRCLE, layer.kind)
+            if not len(kind):
+                continue
+            bounds = (np.flatnonzero(kind[1:] != kind[:-1]) + 1).tolist()
+            for start, stop in zip([0] + bounds, bounds + [len(kind)]):
+                if kind[start] != run_kind:
+                    self._draw_run(run, run_kind)
+                    run, run_kind = [], kind[start]
+                if run_kind == _GeomArrays.OTHER:
+                    for i in range(start, stop):
+                        self._draw_other(layer._prims[i][0])
+                else:
+                    run.append((layer, start, stop))
+        self._draw_run(run, run_kind)
+
+    def _draw_run(self, run, kind):
+        # run: (layer, start, stop) row slices, drawn in order
+        if not run:
+            return
+        paths = [layer.path(i) for layer, start, stop in run for i in range(start, stop)]
+        rgba = np.concatenate([layer.rgba[start:stop] for layer, start, stop in run])
+        coll = self._strokes if kind == _GeomArrays.POLYLINE else self._fills
+        if coll is self._fills:
+            coll.set_facecolor(rgba)
+        # Edge tint (half of every channel, alpha included) for the whole run
+        # in one vector op; polylines are stroked in it.
+        coll.set_paths(paths)
+        coll.set_edgecolor(rgba * 0.5)
+        coll.set_linewidth(np.concatenate([layer.lw[start:stop] for layer, start, stop in run]))
+        self.ax.draw_artist(coll)
+
+    def _draw_other(self, geom):
+        # Custom Geom subclasses add their artists to ax (the Geom.draw
+        # contract); blit whatever was added, then remove it again so neither
+        # the cached background nor later frames see it.
+        before = set(self.ax.get_children())
+        geom.draw(self.ax)
+        added = [a for a in self.ax.get_children() if a not in before]
+        for artist in sorted(added, key=lambda a: a.get_zorder()):
+            self.ax.draw_artist(artist)
+            artist.remove()
+
+    def _pixel_matrix(self):
+        # Map data coordinates to pixels of the axes' own image (row 0 at the
+        # top), laid out exactly like the matplotlib path would place them.
+        if self._px is None:
+            self.ax.apply_aspect()
+            x0, y0, x1, y1 = (int(round(v)) for v in self.ax.bbox.extents)
+            flip = np.array([[1.0, 0.0, -x0], [0.0, -1.0, y1], [0.0, 0.0, 1.0]])
+            self._px = (flip @ self.ax.transData.get_matrix(), (x0, y0, x1, y1))
+        return self._px
+
+    def _rasterize(self, disks, out=None):
+        """Render disk batches with the numba kernel, bypassing matplotlib.
+
+        disks is a sequence of (xyr, rgba, lw) arrays in data coordinates
+        (lw in points, as for matplotlib), painted in order.
+        """
+        m, (x0, y0, x1, y1) = self._pixel_matrix()
+        scale = _similarity_scale(m)  # uniform: the axes keep an equal aspect
+        w, h = self._wh
+        img = np.empty((h, w, 3), dtype=np.uint8) if out is None else out
+        img.fill(255)
+        if (x0, y0, x1, y1) == (0, 0, w, h):
+            axes_img = img
+        else:
+            if self._scratch is None or self._scratch.shape != (y1 - y0, x1 - x0, 3):
+                self._scratch = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+            axes_img = self._scratch
+            axes_img.fill(255)
+        for xyr, rgba, lw in disks:
+            if not len(xyr):
+                continue
+            xy = xyr[:, :2] @ m[:2, :2].T + m[:2, 2]
+            cx = np.ascontiguousarray(xy[:, 0], dtype=np.float32)
+            cy = np.ascontiguousarray(xy[:, 1], dtype=np.float32)
+            r = (xyr[:, 2] * scale).astype(np.float32)
+            w = (lw * (self.figure.dpi / 72.0)).astype(np.float32)
+            face = np.round(rgba * 255.0).astype(np.uint8)
+            # edge tint as in _draw_run: half of every channel, alpha included
+            edge = np.round(rgba * 127.5).astype(np.uint8)
+            raster_disks(axes_img, cx, cy, r, w, face, edge)
+        if axes_img is not img:
+            img[h - y1:h - y0, x0:x1] = axes_img
+        return img
+
+    # out: optional preallocated C-contiguous (H, W, 3) uint8 array the frame is
+    # written into (and returned), for callers that reuse one buffer per frame.
+    def render(self, return_rgb_array=False, out=None):
+        if out is not None:
+            w, h = self._wh
+            if out.shape != (h, w, 3) or out.dtype != np.uint8 or not out.flags.c_contiguous:
+                raise ValueError(f"out must be a C-contiguous ({h}, {w}, 3) uint8 array, got "
+                                 f"{out.shape} {out.dtype} (c_contiguous={out.flags.c_contiguous})")
+        use_raster = return_rgb_array and raster_disks is not None
+        if use_raster and not self._geoms.geoms and all(isinstance(g, Circle) for g in self.onetime_geoms):
+            # Single-layer fast path: only one-time disks, so gather their
+            # arrays directly instead of going through a _GeomArrays.
+            geoms = self.onetime_geoms
+            xyr = np.empty((len(geoms), 3))
+            rgba = np.empty((len(geoms), 4), dtype=np.float32)
+            lw = np.empty(len(geoms), dtype=np.float32)
+            for k, g in enumerate(geoms):
+                m = g._collect_matrix()
+                scale = _similarity_scale(m)
+                if scale is None:
+                    # an ellipse: leave it to the general path
+                    break
+                xyr[k] = (m[0, 2], m[1, 2], g.radius * scale)
+                rgba[k] = g._color.rgba
+                lw[k] = g._linewidth.stroke
+            else:
+                self.onetime_geoms = []
+                return self._rasterize([(xyr, rgba, lw)], out)
+
+        layers = (self._geoms, _GeomArrays(self.onetime_geoms))
+        for layer in layers:
+            layer.sync()
+        # Clear one-time geoms after draw (API parity)
+        self.onetime_geoms = []
 
-    def render(self, return_rgb_array=False):
-        self._prepare_axes()
+        # All-disk scenes (the common MPE case) skip matplotlib entirely.
+        if use_raster and all((layer.kind == _GeomArrays.CIRCLE).all() and layer.round.all() for layer in layers):
+            return self._rasterize([(layer.xyr, layer.rgba, layer.lw) for layer in layers], out)
 
-        # Draw persistent geoms
-        for g in self.geoms:
-            g.draw(self.ax)
-        # Draw one-time geoms
-        for g in self.onetime_geoms:
-            g.draw(self.ax)
+        if self._bg is None:
+            # Full redraw of the (artist-free) axes only when invalidated;
+            # every other frame starts from the cached background.
+            self.canvas.draw()
+            self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        else:
+            self.canvas.restore_region(self._bg)
 
-        # Clear one-time geoms after draw (API parity)
-        self.onetime_geoms = []
+        # Geoms are mutated between frames (transforms, colors), so both
+        # persistent and one-time geoms are drawn as animated artists.
+        self._draw_layers(layers)
 
-        self.canvas.draw()
+        self.canvas.blit(self.ax.bbox)
 
         if return_rgb_array:
-            w, h = self.canvas.get_width_height()
-            buf = np.frombuffer(self.canvas.tostring_argb(), dtype=np.uint8)
-            arr = buf.reshape((h, w, 4))[:, :, :3]  # drop alpha
+            # buffer_rgba() is a zero-copy memoryview of the renderer's buffer,
+            # so dropping alpha is just a view; the one copy (RGB bytes only)
+            # keeps the returned frame valid across renders.
+            w, h = self._wh
+            mv = self.canvas.buffer_rgba()
+            rgb = np.frombuffer(mv, dtype=np.uint8).reshape(h, w, 4)[:, :, :3]  # drop alpha
+            arr = np.empty((h, w, 3), dtype=np.uint8) if out is None else out
+            np.copyto(arr, rgb)
             # The original pyglet path returned an array with origin at the *top*.
             # Agg already returns top-origin buffers; if you need bottom-origin, flip here:
             # arr = arr[::-1, :, :]
@@ -285,14 +771,21 @@ class Viewer:
 
     # Convenience drawing helpers (kept for API parity, rarely used)
     def draw_circle(self, radius=10, res=30, filled=True, **attrs):
-        geom = make_circle(radius=radius, res=res, filled=filled)
-        _add_attrs(geom, attrs)
+        color = tuple(attrs.get("color", (0.0, 0.0, 0.0)))
+        if len(color) == 3:
+            color += (1.0,)
+        template = make_circle_cached(float(radius), *map(float, color), float(attrs.get("linewidth", 1.0)))
+        geom = _clone(template)
         self.add_onetime(geom)
         return geom
 
     def draw_polygon(self, v, filled=True, **attrs):
-        geom = make_polygon(v=v, filled=filled)
-        _add_attrs(geom, attrs)
+        color = tuple(attrs.get("color", (0.0, 0.0, 0.0)))
+        if len(color) == 3:
+            color += (1.0,)
+        v = tuple(map(tuple, np.asarray(v, dtype=float).tolist()))
+        template = make_polygon_cached(v, bool(filled), *map(float, color), float(attrs.get("linewidth", 1.0)))
+        geom = _clone(template)
         self.add_onetime(geom)
         return geom
 
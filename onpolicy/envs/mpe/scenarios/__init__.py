@@ -1,24 +1,46 @@
 import importlib.util
 import os.path as osp
+import re
 import sys
-from uuid import uuid4
 from types import ModuleType
 
+# Loaded scenario modules, keyed by real path, so repeated loads (e.g. one per
+# vectorized env worker) reuse the module instead of re-executing it.
+_LOADED: dict[str, ModuleType] = {}
+
 def load(name: str) -> ModuleType:
     """Dynamically load a Python module from a path relative to this file."""
     pathname = osp.join(osp.dirname(__file__), name)
     if not osp.isfile(pathname):
         raise FileNotFoundError(pathname)
 
-    # Give it a unique name to avoid collisions in sys.modules
-    module_name = f"_dynamic_{osp.splitext(osp.basename(name))[0]}_{uuid4().hex}"
+    key = osp.realpath(pathname)
+    cached = _LOADED.get(key)
+    if cached is not None:
+        return cached
+
+    # Stable, prefixed name built from the relative path (not just the
+    # basename), so same-named scenarios in different subdirectories and
+    # regular imports do not collide in sys.modules
+    rel = osp.splitext(osp.normpath(name))[0]
+    module_name = "_mpe_scenario_" + re.sub(r"\W", "_", rel)
 
     spec = importlib.util.spec_from_file_location(module_name, pathname)
     if spec is None or spec.loader is None:
         raise ImportError(f"Cannot create spec for {pathname}")
 
     module = importlib.util.module_from_spec(spec)
-    # Register so imports inside the loaded module (if any) can resolve by name
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+    # Register so imports inside the loaded module (if any) can resolve by name,
+    # unless a different file already holds that name (e.g. "a_b.py" vs "a/b.py")
+    registered = module_name not in sys.modules
+    if registered:
+        sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Drop the half-initialised module so a retry registers a fresh one
+        if registered and sys.modules.get(module_name) is module:
+            del sys.modules[module_name]
+        raise
+    _LOADED[key] = module
     return module